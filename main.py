@@ -2,19 +2,25 @@ import os
 import sys
 import plistlib
 import re
-import aiohttp
 import asyncio
 import shutil
 import json
+import math
+import operator
+import time
 import concurrent.futures
 import subprocess
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from lxml import etree
 from packaging import version
-import toml
+import tomllib
+import httpx
 
-# Additional imports for implementing retry logic in HTTP requests
-from aiohttp import ClientSession, TCPConnector
-from aiohttp_retry import RetryClient, ExponentialRetry
+# uvloop provides a faster event loop but is only available on POSIX platforms
+if sys.platform != "win32":
+    import uvloop
+else:
+    uvloop = None
 
 # ANSI escape codes for colored terminal output to enhance readability
 CRIMSON = "\033[91m"
@@ -26,9 +32,24 @@ RESET = "\033[0m"
 # URL from which to fetch the config.toml file
 CONFIG_URL = "https://raw.githubusercontent.com/AliceWektron/versiontracker/refs/heads/main/config.toml"
 
-# Semaphore limit for concurrent HTTP requests
+# Limit for concurrent HTTP requests
 SEM_LIMIT = 20  # Adjust based on your system/network capabilities
 
+# Timeout in seconds for each HTTP request as a whole, including streamed reads;
+# httpx also applies it separately to each connect, read, write and pool phase
+HTTP_TIMEOUT = 10
+
+# On-disk cache of latest versions, keyed by bundle identifier, reused across runs
+VERSION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "versiontracker", "latest.json")
+VERSION_CACHE_TTL = 6 * 3600  # Seconds before a cached latest version is fetched again
+
+# Maximum number of applications queried per mdls invocation
+MDLS_BATCH_SIZE = 200
+
+# Precompiled patterns used when normalizing version strings
+BUILD_METADATA_RE = re.compile(r'[\(\)]')
+NON_DIGIT_RUN_RE = re.compile(r'[^0-9]+')
+
 # In-memory storage for installed application versions
 installed_versions = {}
 
@@ -64,29 +85,36 @@ def parse_info_plist(app_path):
         # Return empty strings if the Info.plist is missing or invalid
         return "", "", "", ""
 
-def find_app_folders(root_dir):
+def find_app_folders(root_dir, max_depth=3):
     """
-    Recursively search for all .app directories within a specified root directory.
+    Search for all .app directories within a specified root directory.
 
     Args:
         root_dir (str): The directory to begin searching from.
+        max_depth (int): Maximum directory depth below root_dir at which .app directories are found.
 
     Returns:
         list: A list of paths to .app directories found.
     """
     app_folders = []
-    try:
-        with os.scandir(root_dir) as it:
-            for entry in it:
-                if entry.is_dir(follow_symlinks=False):
+    # Walk the directory tree with an explicit stack of (path, depth) pairs instead of recursion
+    pending_dirs = [(root_dir, 0)]
+    while pending_dirs:
+        current_dir, depth = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
                     if entry.name.endswith('.app'):
+                        # Record the bundle without descending into it
                         app_folders.append(entry.path)
-                    else:
-                        # Recursively search subdirectories
-                        app_folders.extend(find_app_folders(entry.path))
-    except PermissionError:
-        # Skip directories that cannot be accessed due to permission issues
-        pass
+                    elif depth + 1 < max_depth:
+                        # Applications live at most a few category folders deep
+                        pending_dirs.append((entry.path, depth + 1))
+        except PermissionError:
+            # Skip directories that cannot be accessed due to permission issues
+            pass
     return app_folders
 
 def normalize_version(version_string):
@@ -100,14 +128,28 @@ def normalize_version(version_string):
         str: A cleaned and standardized version string.
     """
     # Remove build metadata in parentheses
-    main_version = re.split(r'[\(\)]', version_string)[0]
-    # Retain only digits and dots, replacing other characters with dots
-    normalized_version = ''.join(c if c.isdigit() or c == '.' else '.' for c in main_version)
-    # Replace multiple consecutive dots with a single dot
-    normalized_version = re.sub(r'\.+', '.', normalized_version)
+    main_version = BUILD_METADATA_RE.split(version_string, 1)[0]
+    # Retain only digits, replacing each run of other characters (dots included) with a single dot
+    normalized_version = NON_DIGIT_RUN_RE.sub('.', main_version)
     # Remove leading and trailing dots
     return normalized_version.strip('.')
 
+@lru_cache(maxsize=4096)
+def parse_normalized_version(version_string):
+    """
+    Normalize and parse a version string, caching the result for repeated inputs.
+
+    Args:
+        version_string (str): The original version string.
+
+    Returns:
+        Version: The parsed version, or None if it cannot be parsed.
+    """
+    try:
+        return version.parse(normalize_version(version_string))
+    except version.InvalidVersion:
+        return None
+
 def compare_versions(installed_version, latest_version):
     """
     Compare two version strings, ignoring metadata, and handling cases with build numbers.
@@ -119,61 +161,123 @@ def compare_versions(installed_version, latest_version):
     Returns:
         str: "update_available", "up_to_date", "versions_equal", or "unknown".
     """
-    try:
-        # Parse normalized main versions
-        installed_version_obj = version.parse(normalize_version(installed_version))
-        latest_version_obj = version.parse(normalize_version(latest_version))
-        
-        # Compare main versions first
-        if installed_version_obj < latest_version_obj:
+    # Identical strings, or an installed version extending the latest one, need no parsing
+    if installed_version == latest_version:
+        return "versions_equal"
+    if latest_version and installed_version.startswith(latest_version):
+        return "up_to_date"
+
+    # Parse normalized main versions
+    installed_version_obj = parse_normalized_version(installed_version)
+    latest_version_obj = parse_normalized_version(latest_version)
+    if installed_version_obj is None or latest_version_obj is None:
+        return "unknown"
+
+    # Compare main versions first
+    if installed_version_obj < latest_version_obj:
+        return "update_available"
+    elif installed_version_obj > latest_version_obj:
+        return "up_to_date"
+
+    # Optional: Additional logic for build metadata comparison (e.g., within parentheses)
+    installed_build = re.search(r'\((\d+)\)', installed_version)
+    latest_build = re.search(r'\((\d+)\)', latest_version)
+
+    if installed_build and latest_build:
+        installed_build_num = int(installed_build.group(1))
+        latest_build_num = int(latest_build.group(1))
+        if installed_build_num < latest_build_num:
             return "update_available"
-        elif installed_version_obj > latest_version_obj:
+        elif installed_build_num > latest_build_num:
             return "up_to_date"
-        
-        # Optional: Additional logic for build metadata comparison (e.g., within parentheses)
-        installed_build = re.search(r'\((\d+)\)', installed_version)
-        latest_build = re.search(r'\((\d+)\)', latest_version)
-        
-        if installed_build and latest_build:
-            installed_build_num = int(installed_build.group(1))
-            latest_build_num = int(latest_build.group(1))
-            if installed_build_num < latest_build_num:
-                return "update_available"
-            elif installed_build_num > latest_build_num:
-                return "up_to_date"
 
-        return "versions_equal"
+    return "versions_equal"
 
-    except version.InvalidVersion:
-        return "unknown"
+def get_mdls_versions(app_paths):
+    """
+    Retrieve application versions using a batched macOS `mdls` command.
 
-def get_mdls_version(app_path):
+    Args:
+        app_paths (list): Paths to the .app directories.
+
+    Returns:
+        dict: Mapping of app path to the version string retrieved from metadata.
+              Paths whose version could not be retrieved are omitted.
     """
-    Retrieve the application version using the macOS `mdls` command.
+    mdls_versions = {}
+    for start in range(0, len(app_paths), MDLS_BATCH_SIZE):
+        batch = app_paths[start:start + MDLS_BATCH_SIZE]
+        try:
+            mdls_output = subprocess.check_output(
+                ["mdls", "-raw", "-name", "kMDItemVersion", *batch],
+                stderr=subprocess.DEVNULL
+            )
+        except subprocess.CalledProcessError:
+            # Leave the batch unresolved if the mdls command fails
+            continue
+        # With -raw, mdls separates the value for each file with a null byte
+        for app_path, version_str in zip(batch, mdls_output.decode("utf-8").split("\0")):
+            if version_str and version_str != "(null)":
+                mdls_versions[app_path] = version_str
+    return mdls_versions
+
+def load_version_cache(cache_path):
+    """
+    Load the on-disk cache of previously retrieved latest versions.
 
     Args:
-        app_path (str): Path to the .app directory.
+        cache_path (str): Path to the JSON cache file.
 
     Returns:
-        str: The version string retrieved from metadata, or an empty string if unsuccessful.
+        dict: Mapping of bundle identifier to [timestamp, latest_version].
     """
     try:
-        mdls_output = subprocess.check_output(
-            ["mdls", "-name", "kMDItemVersion", app_path],
-            stderr=subprocess.DEVNULL
-        )
-        version_str = mdls_output.decode("utf-8").strip().replace('kMDItemVersion = "', '').replace('"', '')
-        return version_str
-    except subprocess.CalledProcessError:
-        # Return empty string if the mdls command fails
-        return ""
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            version_cache = json.load(cache_file)
+    except (OSError, ValueError):
+        # Start with an empty cache if the file is missing or corrupt (invalid UTF-8 or JSON)
+        return {}
+    if not isinstance(version_cache, dict):
+        return {}
+    # Keep only well-formed [timestamp, latest_version] entries; timestamps that are
+    # not finite or lie in the future (e.g. after a clock correction) would never expire
+    now = time.time()
+    return {
+        identifier: cached_entry
+        for identifier, cached_entry in version_cache.items()
+        if isinstance(cached_entry, list)
+        and len(cached_entry) == 2
+        and isinstance(cached_entry[0], (int, float))
+        and not isinstance(cached_entry[0], bool)
+        and math.isfinite(cached_entry[0])
+        and cached_entry[0] <= now
+        and isinstance(cached_entry[1], str)
+    }
+
+def save_version_cache(version_cache, cache_path):
+    """
+    Atomically write the cache of latest versions to disk.
+
+    Args:
+        version_cache (dict): Mapping of bundle identifier to [timestamp, latest_version].
+        cache_path (str): Path to the JSON cache file.
+    """
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(version_cache, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is an optimization only, so failing to write it is not fatal
+        pass
 
 async def fetch_config(session, url):
     """
     Asynchronously fetch and parse the config.toml file from a given URL.
 
     Args:
-        session (aiohttp.ClientSession): The HTTP session for making requests.
+        session (httpx.AsyncClient): The HTTP client for making requests.
         url (str): The URL to fetch the config.toml from.
 
     Returns:
@@ -183,24 +287,47 @@ async def fetch_config(session, url):
         RuntimeError: If the config file cannot be fetched or parsed.
     """
     try:
-        async with session.get(url, timeout=10) as response:
-            response.raise_for_status()
-            config_text = await response.text()
-            config_data = toml.loads(config_text)
-            return config_data
-    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        async with asyncio.timeout(HTTP_TIMEOUT):
+            response = await session.get(url)
+        response.raise_for_status()
+        config_data = tomllib.loads(response.text)
+        return config_data
+    except (httpx.HTTPError, TimeoutError) as e:
         print(f"{CRIMSON}Failed to fetch config from URL: {e}{RESET}")
         raise RuntimeError("Config fetch failed.")
-    except toml.TomlDecodeError as e:
+    except tomllib.TOMLDecodeError as e:
         print(f"{CRIMSON}Error parsing TOML config from URL: {e}{RESET}")
         raise RuntimeError("Config parsing failed.")
 
+def find_label_value(parser, label, label_cell):
+    """
+    Scan the table cells parsed so far for the cell that follows the label cell.
+
+    Args:
+        parser (lxml.etree.HTMLPullParser): Pull parser emitting "end" events for <td> elements.
+        label (str): The label preceding the value in the HTML.
+        label_cell (lxml.etree._Element): The label cell found in earlier events, or None.
+
+    Returns:
+        tuple: The value string (None until found) and the label cell found so far.
+    """
+    for _, cell in parser.read_events():
+        # The value is the first <td> sibling after the label, skipping comments and other nodes
+        if label_cell is not None and next(cell.itersiblings(tag="td", preceding=True), None) is label_cell:
+            return "".join(cell.itertext()).strip(), label_cell
+        if "".join(cell.itertext()).strip() == label:
+            label_cell = cell
+    return None, label_cell
+
 async def scrape_latest_version(session, url, label):
     """
     Scrape the latest version of an application from the MacUpdater website.
 
+    The page is parsed incrementally as it is received, and the request is
+    finished as soon as the value cell following the label has been parsed.
+
     Args:
-        session (aiohttp.ClientSession): The HTTP session for making requests.
+        session (httpx.AsyncClient): The HTTP client for making requests.
         url (str): The URL of the application's update page.
         label (str): The label preceding the version string in the HTML.
 
@@ -208,32 +335,44 @@ async def scrape_latest_version(session, url, label):
         str: The latest version string if found, else an empty string.
     """
     try:
-        async with session.get(url, timeout=10) as response:
+        async with asyncio.timeout(HTTP_TIMEOUT), session.stream("GET", url) as response:
             response.raise_for_status()
-            text = await response.text()
-            soup = BeautifulSoup(text, "html.parser")
-            for td in soup.find_all("td"):
-                if td.text.strip() == label:
-                    next_td = td.find_next_sibling("td")
-                    if next_td:
-                        return next_td.text.strip()
-    except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Decode with the Content-Type charset when present, else let libxml2 detect it
+            parser = etree.HTMLPullParser(events=("end",), tag="td", encoding=response.charset_encoding)
+            label_cell = None
+            async for chunk in response.aiter_bytes(8192):
+                parser.feed(chunk)
+                value, label_cell = find_label_value(parser, label, label_cell)
+                if value is not None:
+                    return value
+            # Flush any cells still buffered in the parser at the end of the page
+            parser.close()
+            value, label_cell = find_label_value(parser, label, label_cell)
+            if value is not None:
+                return value
+    except (httpx.HTTPError, TimeoutError):
         # Return empty string if the request fails or times out
         return ""
+    except etree.LxmlError:
+        # Return empty string if the page body is empty or unparseable
+        return ""
     return ""
 
-async def fetch_latest_version_for_app(app_entry, session, semaphore, identifier_mappings):
+async def fetch_latest_version_for_app(app_entry, session, identifier_mappings, version_cache):
     """
     Asynchronously fetch the latest version for a single application.
 
+    A cached latest version younger than VERSION_CACHE_TTL is used instead of
+    scraping MacUpdater again.
+
     Args:
         app_entry (list): A list containing app details [executable, identifier, installed_version].
-        session (aiohttp.ClientSession): The HTTP session for making requests.
-        semaphore (asyncio.Semaphore): Semaphore to limit concurrent requests.
+        session (httpx.AsyncClient): The HTTP client for making requests.
         identifier_mappings (dict): Mappings to correct bundle identifiers if necessary.
+        version_cache (dict): Cache of latest versions, updated with newly fetched versions.
 
     Returns:
-        list: Updated app_entry with the latest version appended.
+        tuple: Updated app_entry with the latest version appended, and whether an update is available.
     """
     bundle_executable, bundle_identifier, installed_version = app_entry
 
@@ -243,9 +382,14 @@ async def fetch_latest_version_for_app(app_entry, session, semaphore, identifier
     # Construct the MacUpdater URL for the application
     macupdater_url = f"https://macupdater.net/app_updates/appinfo/{corrected_bundle_identifier}/index.html"
 
-    # Limit the number of concurrent requests using semaphore
-    async with semaphore:
+    now = time.time()
+    cached_entry = version_cache.get(corrected_bundle_identifier)
+    if cached_entry and 0 <= now - cached_entry[0] < VERSION_CACHE_TTL:
+        latest_version = cached_entry[1]
+    else:
         latest_version = await scrape_latest_version(session, macupdater_url, "Version String:")
+        if latest_version:
+            version_cache[corrected_bundle_identifier] = [now, latest_version]
 
     # Append the latest version to the app_entry
     app_entry.append(latest_version)
@@ -256,26 +400,58 @@ async def fetch_latest_version_for_app(app_entry, session, semaphore, identifier
     else:
         print(f"{CERULEAN_BLUE}Retrieving {bundle_executable}, {bundle_identifier} {CRIMSON}*Unavailable*{RESET}")
 
-    return app_entry
+    if not installed_version or not latest_version:
+        return app_entry, False  # Skip applications with incomplete version information
+
+    # Compare installed and latest versions to determine update necessity
+    return app_entry, compare_versions(installed_version, latest_version) == "update_available"
+
+async def fetch_latest_versions_worker(queue, results, session, identifier_mappings, version_cache):
+    """
+    Fetch the latest versions for queued applications until the queue is drained.
+
+    Args:
+        queue (asyncio.Queue): Queue of (index, app_entry) pairs to process.
+        results (list): Per-index storage for the (app_entry, is_update) results.
+        session (httpx.AsyncClient): The HTTP client for making requests.
+        identifier_mappings (dict): Mappings to correct bundle identifiers if necessary.
+        version_cache (dict): Cache of latest versions shared by all workers.
+    """
+    while True:
+        try:
+            index, app_entry = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        results[index] = await fetch_latest_version_for_app(app_entry, session, identifier_mappings, version_cache)
+        queue.task_done()
 
-async def fetch_latest_versions(app_data, session, semaphore, identifier_mappings):
+async def fetch_latest_versions(app_data, session, identifier_mappings, version_cache):
     """
-    Asynchronously fetch the latest versions for all applications.
+    Asynchronously fetch the latest versions for all applications and identify available updates.
+
+    A fixed pool of SEM_LIMIT workers drains a queue of entries, so the number of
+    in-flight requests is bounded without creating a task per application.
 
     Args:
         app_data (list): A list of application data entries.
-        session (aiohttp.ClientSession): The HTTP session for making requests.
-        semaphore (asyncio.Semaphore): Semaphore to limit concurrent requests.
+        session (httpx.AsyncClient): The HTTP client for making requests.
         identifier_mappings (dict): Mappings to correct bundle identifiers if necessary.
+        version_cache (dict): Cache of latest versions, updated with newly fetched versions.
 
     Returns:
-        list: A list of updated application data entries with latest versions.
+        list: Application data entries, in their original order, that have an update available.
     """
-    tasks = [
-        fetch_latest_version_for_app(app_entry, session, semaphore, identifier_mappings)
-        for app_entry in app_data
+    queue = asyncio.Queue()
+    for index_entry in enumerate(app_data):
+        queue.put_nowait(index_entry)
+
+    results = [None] * len(app_data)
+    workers = [
+        fetch_latest_versions_worker(queue, results, session, identifier_mappings, version_cache)
+        for _ in range(min(SEM_LIMIT, len(app_data)))
     ]
-    return await asyncio.gather(*tasks)
+    await asyncio.gather(*workers)
+    return [app_entry for app_entry, is_update in results if is_update]
 
 def load_all_info_plists(app_folders, ignore_app_names, app_name_mappings):
     """
@@ -287,43 +463,59 @@ def load_all_info_plists(app_folders, ignore_app_names, app_name_mappings):
         app_name_mappings (dict): Mappings to rename executables if necessary.
 
     Returns:
-        list: A list of application data entries [executable, identifier, installed_version].
+        list: A list of (sort_key, [executable, identifier, installed_version]) pairs, where sort_key
+              is the lowercased executable name.
     """
-    app_data = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit tasks to the thread pool for retrieving mdls versions
-        futures = {executor.submit(get_mdls_version, app_folder): app_folder for app_folder in app_folders}
-        for future in concurrent.futures.as_completed(futures):
-            app_folder = futures[future]
-            mdls_version = future.result()
-            bundle_executable, bundle_identifier, bundle_version, bundle_short_version = parse_info_plist(app_folder)
+    # Read the small Info.plist files concurrently; threads suffice since the work is I/O bound
+    plist_results = []
+    if app_folders:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(app_folders))) as executor:
+            plist_results = list(executor.map(parse_info_plist, app_folders))
+
+    plist_entries = []
+    for app_folder, plist_result in zip(app_folders, plist_results):
+        bundle_executable, bundle_identifier, bundle_version, bundle_short_version = plist_result
 
-            # Skip applications with missing essential information
-            if not bundle_executable or not bundle_identifier:
-                continue
+        # Skip applications with missing essential information
+        if not bundle_executable or not bundle_identifier:
+            continue
 
-            # Exclude applications specified in the ignore list
-            if bundle_executable in ignore_app_names:
-                continue
+        # Exclude applications specified in the ignore list
+        if bundle_executable in ignore_app_names:
+            continue
 
-            # Apply executable name mapping if applicable
-            bundle_executable = app_name_mappings.get(bundle_executable, bundle_executable)
+        # Apply executable name mapping if applicable
+        bundle_executable = app_name_mappings.get(bundle_executable, bundle_executable)
 
-            # Determine the build version by comparing bundle and mdls versions
-            build_version = ""
-            if bundle_version and bundle_version != mdls_version:
-                build_version = bundle_version
-            elif bundle_short_version and bundle_short_version != mdls_version:
-                build_version = bundle_short_version
+        plist_entries.append((app_folder, bundle_executable, bundle_identifier, bundle_version, bundle_short_version))
 
-            # Format the installed version string
-            installed_version = f"{mdls_version} ({build_version})" if build_version else mdls_version
+    # The Info.plist version fields are what mdls reports as kMDItemVersion,
+    # so only query mdls, in a single batch, for plists that provide neither
+    mdls_versions = get_mdls_versions([
+        app_folder
+        for app_folder, _, _, bundle_version, bundle_short_version in plist_entries
+        if not bundle_version and not bundle_short_version
+    ])
 
-            # Store the installed version in the in-memory dictionary
-            installed_versions[bundle_identifier] = installed_version
+    app_data = []
+    for app_folder, bundle_executable, bundle_identifier, bundle_version, bundle_short_version in plist_entries:
+        mdls_version = bundle_short_version or bundle_version or mdls_versions.get(app_folder, "")
+
+        # Determine the build version by comparing bundle and mdls versions
+        build_version = ""
+        if bundle_version and bundle_version != mdls_version:
+            build_version = bundle_version
+        elif bundle_short_version and bundle_short_version != mdls_version:
+            build_version = bundle_short_version
+
+        # Format the installed version string
+        installed_version = f"{mdls_version} ({build_version})" if build_version else mdls_version
 
-            # Append application data with a placeholder for the latest version
-            app_data.append([bundle_executable, bundle_identifier, installed_version])
+        # Store the installed version in the in-memory dictionary
+        installed_versions[bundle_identifier] = installed_version
+
+        # Append application data, keyed by its lowercased name for sorting
+        app_data.append((bundle_executable.lower(), [bundle_executable, bundle_identifier, installed_version]))
 
     return app_data
 
@@ -335,15 +527,29 @@ async def main_async(config_url):
     Args:
         config_url (str): The URL from which to fetch the config.toml file.
     """
-    # Initialize retry options for HTTP requests
-    retry_options = ExponentialRetry(attempts=3)
-    connector = TCPConnector(limit_per_host=SEM_LIMIT)
-
-    # Initialize RetryClient with specified retry options
-    async with RetryClient(
-        raise_for_status=False,
-        client_session=ClientSession(connector=connector),
-        retry_options=retry_options
+    # Multiplex all requests over HTTP/2 and keep connections alive so every request
+    # to the same host reuses an established TCP/TLS connection; failed connection
+    # attempts are retried by the transport
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(
+            max_connections=SEM_LIMIT,
+            max_keepalive_connections=SEM_LIMIT,
+            keepalive_expiry=75
+        )
+    )
+
+    # trust_env=False ignores HTTP(S)_PROXY, SSL_CERT_FILE/SSL_CERT_DIR and .netrc from the
+    # environment. Requests only go, unauthenticated, to two public HTTPS hosts that are
+    # verified against httpx's bundled certificates, so direct connections need none of
+    # these; machines that can only reach the internet through a proxy are not supported
+    async with httpx.AsyncClient(
+        transport=transport,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        trust_env=False,
+        headers={"User-Agent": "versiontracker"}
     ) as session:
         # Fetch and parse the configuration from the provided URL
         try:
@@ -369,42 +575,18 @@ async def main_async(config_url):
         app_data = load_all_info_plists(app_folders, ignore_app_names, app_name_mappings)
 
         # Sort applications alphabetically by their name (case-insensitive)
-        app_data.sort(key=lambda x: x[0].lower())
-
-        # Create a semaphore to limit concurrent HTTP requests
-        semaphore = asyncio.Semaphore(SEM_LIMIT)
+        app_data.sort(key=operator.itemgetter(0))
+        app_data = [app_entry for _, app_entry in app_data]
 
-        # Fetch the latest available versions for all applications
-        await fetch_latest_versions(app_data, session, semaphore, identifier_mappings)
+        # Fetch the latest available versions and collect applications that have updates,
+        # reusing recently retrieved versions from the on-disk cache
+        version_cache = load_version_cache(VERSION_CACHE_PATH)
+        updates = await fetch_latest_versions(app_data, session, identifier_mappings, version_cache)
+        save_version_cache(version_cache, VERSION_CACHE_PATH)
 
         # Notify the user that the retrieval process is complete
         print(f"\n{NEON_GREEN}Retrieved installed and latest app versions.{RESET}")
 
-        # Initialize a list to hold applications that have available updates
-        updates = []
-
-        # Iterate through each application's data to determine if an update is needed
-        for app_entry in app_data:
-            if len(app_entry) < 4:
-                continue  # Ensure that the latest_version field exists
-
-            app_name, bundle_identifier, installed_version, latest_version = app_entry
-
-            if not installed_version or not latest_version:
-                continue  # Skip applications with incomplete version information
-
-            # Skip if the installed version already matches or exceeds the latest version
-            if latest_version in installed_version or installed_version.startswith(latest_version):
-                continue
-
-            # Compare installed and latest versions to determine update necessity
-            comparison_result = compare_versions(installed_version, latest_version)
-
-            if comparison_result == "update_available":
-                updates.append(app_entry)
-            elif comparison_result == "unknown":
-                continue  # Unable to determine version comparison
-
         # Display the list of applications that have available updates
         if updates:
             print(f"\n{VIOLET}Available Updates:{RESET}\n")
@@ -421,8 +603,12 @@ def main():
     The main function orchestrates the asynchronous retrieval of configuration,
     fetching of installed and latest application versions, and identifying updates.
     """
-    # Run the asynchronous main function with the specified config URL
-    asyncio.run(main_async(CONFIG_URL))
+    # Run the asynchronous main function with the specified config URL,
+    # using the uvloop event loop where it is available
+    if uvloop is not None:
+        uvloop.run(main_async(CONFIG_URL))
+    else:
+        asyncio.run(main_async(CONFIG_URL))
 
 if __name__ == "__main__":
     main()